@@ -5,9 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	app_errors "gpt-load/internal/errors"
 	"gpt-load/internal/models"
-	"io"
 	"net/http"
 	"net/url"
 	"strings"
@@ -21,6 +19,7 @@ func init() {
 
 type AnthropicChannel struct {
 	*BaseChannel
+	validationBody []byte
 }
 
 func newAnthropicChannel(f *Factory, group *models.Group) (ChannelProxy, error) {
@@ -29,14 +28,32 @@ func newAnthropicChannel(f *Factory, group *models.Group) (ChannelProxy, error)
 		return nil, err
 	}
 
+	// Use a minimal, low-cost payload for validation
+	validationBody, err := json.Marshal(gin.H{
+		"model":      group.TestModel,
+		"max_tokens": 100,
+		"messages": []gin.H{
+			{"role": "user", "content": "hi"},
+		},
+	})
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal validation payload: %w", err)
+	}
+
 	return &AnthropicChannel{
-		BaseChannel: base,
+		BaseChannel:    base,
+		validationBody: validationBody,
 	}, nil
 }
 
 // ModifyRequest sets the required headers for the Anthropic API.
 func (ch *AnthropicChannel) ModifyRequest(req *http.Request, apiKey *models.APIKey, group *models.Group) {
-	req.Header.Set("x-api-key", apiKey.KeyValue)
+	setAnthropicAuthHeaders(req, apiKey.KeyValue)
+}
+
+// setAnthropicAuthHeaders sets the API key and version headers required by the Anthropic API.
+func setAnthropicAuthHeaders(req *http.Request, key string) {
+	req.Header.Set("x-api-key", key)
 	req.Header.Set("anthropic-version", "2023-06-01")
 }
 
@@ -61,7 +78,8 @@ func (ch *AnthropicChannel) IsStreamRequest(c *gin.Context, bodyBytes []byte) bo
 	return false
 }
 
-// ValidateKey checks if the given API key is valid by making a messages request.
+// ValidateKey checks if the given API key is valid by making a messages request,
+// or a GET on the test model when the validation endpoint is the models API.
 func (ch *AnthropicChannel) ValidateKey(ctx context.Context, key string) (bool, error) {
 	upstreamURL := ch.getUpstreamURL()
 	if upstreamURL == nil {
@@ -77,25 +95,17 @@ func (ch *AnthropicChannel) ValidateKey(ctx context.Context, key string) (bool,
 		return false, fmt.Errorf("failed to join upstream URL and validation endpoint: %w", err)
 	}
 
-	// Use a minimal, low-cost payload for validation
-	payload := gin.H{
-		"model":      ch.TestModel,
-		"max_tokens": 100,
-		"messages": []gin.H{
-			{"role": "user", "content": "hi"},
-		},
-	}
-	body, err := json.Marshal(payload)
-	if err != nil {
-		return false, fmt.Errorf("failed to marshal validation payload: %w", err)
+	if isModelsEndpoint(validationEndpoint) {
+		return ch.validateKeyByModel(ctx, reqURL, func(req *http.Request) {
+			setAnthropicAuthHeaders(req, key)
+		})
 	}
 
-	req, err := http.NewRequestWithContext(ctx, "POST", reqURL, bytes.NewBuffer(body))
+	req, err := http.NewRequestWithContext(ctx, "POST", reqURL, bytes.NewReader(ch.validationBody))
 	if err != nil {
 		return false, fmt.Errorf("failed to create validation request: %w", err)
 	}
-	req.Header.Set("x-api-key", key)
-	req.Header.Set("anthropic-version", "2023-06-01")
+	setAnthropicAuthHeaders(req, key)
 	req.Header.Set("Content-Type", "application/json")
 
 	resp, err := ch.HTTPClient.Do(req)
@@ -104,19 +114,5 @@ func (ch *AnthropicChannel) ValidateKey(ctx context.Context, key string) (bool,
 	}
 	defer resp.Body.Close()
 
-	// A 200 OK status code indicates the key is valid and can make requests.
-	if resp.StatusCode == http.StatusOK {
-		return true, nil
-	}
-
-	// For non-200 responses, parse the body to provide a more specific error reason.
-	errorBody, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return false, fmt.Errorf("key is invalid (status %d), but failed to read error body: %w", resp.StatusCode, err)
-	}
-
-	// Use the new parser to extract a clean error message.
-	parsedError := app_errors.ParseUpstreamError(errorBody)
-
-	return false, fmt.Errorf("[status %d] %s", resp.StatusCode, parsedError)
+	return parseValidationResponse(resp)
 }
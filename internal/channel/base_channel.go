@@ -2,9 +2,12 @@ package channel
 
 import (
 	"bytes"
+	"context"
 	"fmt"
+	app_errors "gpt-load/internal/errors"
 	"gpt-load/internal/models"
 	"gpt-load/internal/types"
+	"io"
 	"net/http"
 	"net/url"
 	"reflect"
@@ -14,6 +17,10 @@ import (
 	"gorm.io/datatypes"
 )
 
+// maxValidationBodySize bounds how much of a validation response body is read.
+// Error messages are truncated well below this, so larger bodies carry no useful information.
+const maxValidationBodySize = 64 * 1024
+
 // UpstreamInfo holds the information for a single upstream server, including its weight.
 type UpstreamInfo struct {
 	URL           *url.URL
@@ -90,6 +97,7 @@ func (b *BaseChannel) BuildUpstreamURL(originalURL *url.URL, group *models.Group
 }
 
 // IsConfigStale checks if the channel's configuration is stale compared to the provided group.
+// Channels may cache data derived from these fields, such as their pre-encoded validation payload.
 func (b *BaseChannel) IsConfigStale(group *models.Group) bool {
 	if b.channelType != group.ChannelType {
 		return true
@@ -118,3 +126,56 @@ func (b *BaseChannel) GetHTTPClient() *http.Client {
 func (b *BaseChannel) GetStreamClient() *http.Client {
 	return b.StreamClient
 }
+
+// isModelsEndpoint reports whether the validation endpoint points at the models API,
+// which allows keys to be validated with a cheap GET instead of a billable completion.
+func isModelsEndpoint(endpoint string) bool {
+	return strings.HasSuffix(strings.TrimRight(endpoint, "/"), "/models")
+}
+
+// discardResponseBody drains a bounded amount of the body so the underlying connection
+// can be returned to the pool instead of being closed.
+func discardResponseBody(body io.Reader) {
+	_, _ = io.Copy(io.Discard, io.LimitReader(body, maxValidationBodySize))
+}
+
+// validateKeyByModel checks a key with a GET on the test model's entry under the models endpoint.
+// It consumes no tokens: 200 means the key can use the model, 401 and 404 are reported as errors.
+func (b *BaseChannel) validateKeyByModel(ctx context.Context, modelsURL string, setAuth func(req *http.Request)) (bool, error) {
+	reqURL, err := url.JoinPath(modelsURL, b.TestModel)
+	if err != nil {
+		return false, fmt.Errorf("failed to join models endpoint and test model: %w", err)
+	}
+
+	req, err := http.NewRequestWithContext(ctx, "GET", reqURL, nil)
+	if err != nil {
+		return false, fmt.Errorf("failed to create validation request: %w", err)
+	}
+	setAuth(req)
+
+	resp, err := b.HTTPClient.Do(req)
+	if err != nil {
+		return false, fmt.Errorf("failed to send validation request: %w", err)
+	}
+	defer resp.Body.Close()
+
+	return parseValidationResponse(resp)
+}
+
+// parseValidationResponse interprets a validation response. A 200 OK means the key is valid;
+// for any other status a bounded part of the body is parsed to give a specific error reason.
+func parseValidationResponse(resp *http.Response) (bool, error) {
+	if resp.StatusCode == http.StatusOK {
+		discardResponseBody(resp.Body)
+		return true, nil
+	}
+
+	errorBody, err := io.ReadAll(io.LimitReader(resp.Body, maxValidationBodySize))
+	if err != nil {
+		return false, fmt.Errorf("key is invalid (status %d), but failed to read error body: %w", resp.StatusCode, err)
+	}
+
+	parsedError := app_errors.ParseUpstreamError(errorBody)
+
+	return false, fmt.Errorf("[status %d] %s", resp.StatusCode, parsedError)
+}
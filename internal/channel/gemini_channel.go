@@ -5,9 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	app_errors "gpt-load/internal/errors"
 	"gpt-load/internal/models"
-	"io"
 	"net/http"
 	"net/url"
 	"strings"
@@ -21,6 +19,7 @@ func init() {
 
 type GeminiChannel struct {
 	*BaseChannel
+	validationBody []byte
 }
 
 func newGeminiChannel(f *Factory, group *models.Group) (ChannelProxy, error) {
@@ -29,8 +28,21 @@ func newGeminiChannel(f *Factory, group *models.Group) (ChannelProxy, error) {
 		return nil, err
 	}
 
+	// Use a minimal, low-cost payload for validation
+	validationBody, err := json.Marshal(gin.H{
+		"contents": []gin.H{
+			{"parts": []gin.H{
+				{"text": "hi"},
+			}},
+		},
+	})
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal validation payload: %w", err)
+	}
+
 	return &GeminiChannel{
-		BaseChannel: base,
+		BaseChannel:    base,
+		validationBody: validationBody,
 	}, nil
 }
 
@@ -85,19 +97,7 @@ func (ch *GeminiChannel) ValidateKey(ctx context.Context, key string) (bool, err
 	}
 	reqURL += "?key=" + key
 
-	payload := gin.H{
-		"contents": []gin.H{
-			{"parts": []gin.H{
-				{"text": "hi"},
-			}},
-		},
-	}
-	body, err := json.Marshal(payload)
-	if err != nil {
-		return false, fmt.Errorf("failed to marshal validation payload: %w", err)
-	}
-
-	req, err := http.NewRequestWithContext(ctx, "POST", reqURL, bytes.NewBuffer(body))
+	req, err := http.NewRequestWithContext(ctx, "POST", reqURL, bytes.NewReader(ch.validationBody))
 	if err != nil {
 		return false, fmt.Errorf("failed to create validation request: %w", err)
 	}
@@ -109,19 +109,5 @@ func (ch *GeminiChannel) ValidateKey(ctx context.Context, key string) (bool, err
 	}
 	defer resp.Body.Close()
 
-	// A 200 OK status code indicates the key is valid.
-	if resp.StatusCode == http.StatusOK {
-		return true, nil
-	}
-
-	// For non-200 responses, parse the body to provide a more specific error reason.
-	errorBody, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return false, fmt.Errorf("key is invalid (status %d), but failed to read error body: %w", resp.StatusCode, err)
-	}
-
-	// Use the new parser to extract a clean error message.
-	parsedError := app_errors.ParseUpstreamError(errorBody)
-
-	return false, fmt.Errorf("[status %d] %s", resp.StatusCode, parsedError)
+	return parseValidationResponse(resp)
 }
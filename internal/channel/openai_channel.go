@@ -5,9 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	app_errors "gpt-load/internal/errors"
 	"gpt-load/internal/models"
-	"io"
 	"net/http"
 	"net/url"
 	"strings"
@@ -21,6 +19,7 @@ func init() {
 
 type OpenAIChannel struct {
 	*BaseChannel
+	validationBody []byte
 }
 
 func newOpenAIChannel(f *Factory, group *models.Group) (ChannelProxy, error) {
@@ -29,8 +28,21 @@ func newOpenAIChannel(f *Factory, group *models.Group) (ChannelProxy, error) {
 		return nil, err
 	}
 
+	// Use a minimal, low-cost payload for validation
+	validationBody, err := json.Marshal(gin.H{
+		"model": group.TestModel,
+		"messages": []gin.H{
+			{"role": "user", "content": "hi"},
+		},
+		"max_tokens": 100,
+	})
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal validation payload: %w", err)
+	}
+
 	return &OpenAIChannel{
-		BaseChannel: base,
+		BaseChannel:    base,
+		validationBody: validationBody,
 	}, nil
 }
 
@@ -60,7 +72,8 @@ func (ch *OpenAIChannel) IsStreamRequest(c *gin.Context, bodyBytes []byte) bool
 	return false
 }
 
-// ValidateKey checks if the given API key is valid by making a chat completion request.
+// ValidateKey checks if the given API key is valid by making a chat completion request,
+// or a GET on the test model when the validation endpoint is the models API.
 func (ch *OpenAIChannel) ValidateKey(ctx context.Context, key string) (bool, error) {
 	upstreamURL := ch.getUpstreamURL()
 	if upstreamURL == nil {
@@ -76,20 +89,13 @@ func (ch *OpenAIChannel) ValidateKey(ctx context.Context, key string) (bool, err
 		return false, fmt.Errorf("failed to join upstream URL and validation endpoint: %w", err)
 	}
 
-	// Use a minimal, low-cost payload for validation
-	payload := gin.H{
-		"model": ch.TestModel,
-		"messages": []gin.H{
-			{"role": "user", "content": "hi"},
-		},
-		"max_tokens": 100,
-	}
-	body, err := json.Marshal(payload)
-	if err != nil {
-		return false, fmt.Errorf("failed to marshal validation payload: %w", err)
+	if isModelsEndpoint(validationEndpoint) {
+		return ch.validateKeyByModel(ctx, reqURL, func(req *http.Request) {
+			req.Header.Set("Authorization", "Bearer "+key)
+		})
 	}
 
-	req, err := http.NewRequestWithContext(ctx, "POST", reqURL, bytes.NewBuffer(body))
+	req, err := http.NewRequestWithContext(ctx, "POST", reqURL, bytes.NewReader(ch.validationBody))
 	if err != nil {
 		return false, fmt.Errorf("failed to create validation request: %w", err)
 	}
@@ -102,19 +108,5 @@ func (ch *OpenAIChannel) ValidateKey(ctx context.Context, key string) (bool, err
 	}
 	defer resp.Body.Close()
 
-	// A 200 OK status code indicates the key is valid and can make requests.
-	if resp.StatusCode == http.StatusOK {
-		return true, nil
-	}
-
-	// For non-200 responses, parse the body to provide a more specific error reason.
-	errorBody, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return false, fmt.Errorf("key is invalid (status %d), but failed to read error body: %w", resp.StatusCode, err)
-	}
-
-	// Use the new parser to extract a clean error message.
-	parsedError := app_errors.ParseUpstreamError(errorBody)
-
-	return false, fmt.Errorf("[status %d] %s", resp.StatusCode, parsedError)
+	return parseValidationResponse(resp)
 }
@@ -12,8 +12,21 @@ import (
 // Stats Get dashboard statistics
 func (s *Server) Stats(c *gin.Context) {
 	var activeKeys, invalidKeys, groupCount int64
-	s.DB.Model(&models.APIKey{}).Where("status = ?", models.KeyStatusActive).Count(&activeKeys)
-	s.DB.Model(&models.APIKey{}).Where("status = ?", models.KeyStatusInvalid).Count(&invalidKeys)
+
+	// Count keys of every status in a single grouped query instead of one scan per status.
+	var keyStatusCounts []struct {
+		Status string
+		Count  int64
+	}
+	s.DB.Model(&models.APIKey{}).Select("status, count(*) as count").Group("status").Scan(&keyStatusCounts)
+	for _, sc := range keyStatusCounts {
+		switch sc.Status {
+		case models.KeyStatusActive:
+			activeKeys = sc.Count
+		case models.KeyStatusInvalid:
+			invalidKeys = sc.Count
+		}
+	}
 	s.DB.Model(&models.Group{}).Count(&groupCount)
 
 	now := time.Now()
@@ -132,7 +132,7 @@ func (s *CronChecker) validateGroupKeys(group *models.Group) {
 	var keyWg sync.WaitGroup
 	jobs := make(chan *models.APIKey, len(invalidKeys))
 
-	concurrency := group.EffectiveConfig.KeyValidationConcurrency
+	concurrency := min(group.EffectiveConfig.KeyValidationConcurrency, len(invalidKeys))
 	for range concurrency {
 		keyWg.Add(1)
 		go func() {
@@ -6,6 +6,7 @@ import (
 	"gpt-load/internal/channel"
 	"gpt-load/internal/config"
 	"gpt-load/internal/models"
+	"sync"
 	"time"
 
 	"github.com/sirupsen/logrus"
@@ -63,19 +64,26 @@ func (s *KeyValidator) ValidateSingleKey(key *models.APIKey, group *models.Group
 
 	s.keypoolProvider.UpdateStatus(key, group, isValid)
 
+	// Skip building per-key log entries when debug logging is off; this runs once per validated key.
+	debugEnabled := logrus.IsLevelEnabled(logrus.DebugLevel)
+
 	if !isValid {
-		logrus.WithFields(logrus.Fields{
-			"error":    validationErr,
-			"key_id":   key.ID,
-			"group_id": group.ID,
-		}).Debug("Key validation failed")
+		if debugEnabled {
+			logrus.WithFields(logrus.Fields{
+				"error":    validationErr,
+				"key_id":   key.ID,
+				"group_id": group.ID,
+			}).Debug("Key validation failed")
+		}
 		return false, validationErr
 	}
 
-	logrus.WithFields(logrus.Fields{
-		"key_id":   key.ID,
-		"is_valid": isValid,
-	}).Debug("Key validation successful")
+	if debugEnabled {
+		logrus.WithFields(logrus.Fields{
+			"key_id":   key.ID,
+			"is_valid": isValid,
+		}).Debug("Key validation successful")
+	}
 
 	return true, nil
 }
@@ -84,6 +92,11 @@ func (s *KeyValidator) ValidateSingleKey(key *models.APIKey, group *models.Group
 func (s *KeyValidator) TestMultipleKeys(group *models.Group, keyValues []string) ([]KeyTestResult, error) {
 	results := make([]KeyTestResult, len(keyValues))
 
+	// Load the effective config before the workers start; ValidateSingleKey only reads it afterwards.
+	if group.EffectiveConfig.AppUrl == "" {
+		group.EffectiveConfig = s.SettingsManager.GetEffectiveConfig(group.Config)
+	}
+
 	// Find which of the provided keys actually exist in the database for this group
 	var existingKeys []models.APIKey
 	if err := s.DB.Where("group_id = ? AND key_value IN ?", group.ID, keyValues).Find(&existingKeys).Error; err != nil {
@@ -94,9 +107,11 @@ func (s *KeyValidator) TestMultipleKeys(group *models.Group, keyValues []string)
 		existingKeyMap[k.KeyValue] = k
 	}
 
+	jobs := make(chan int, len(keyValues))
+	firstIndex := make(map[string]int, len(keyValues))
+	var repeats []int
 	for i, kv := range keyValues {
-		apiKey, exists := existingKeyMap[kv]
-		if !exists {
+		if _, exists := existingKeyMap[kv]; !exists {
 			results[i] = KeyTestResult{
 				KeyValue: kv,
 				IsValid:  false,
@@ -105,16 +120,44 @@ func (s *KeyValidator) TestMultipleKeys(group *models.Group, keyValues []string)
 			continue
 		}
 
-		isValid, validationErr := s.ValidateSingleKey(&apiKey, group)
-
-		results[i] = KeyTestResult{
-			KeyValue: kv,
-			IsValid:  isValid,
-			Error:    "",
-		}
-		if validationErr != nil {
-			results[i].Error = validationErr.Error()
+		// Probe each key once; repeated occurrences reuse the first result.
+		if _, seen := firstIndex[kv]; seen {
+			repeats = append(repeats, i)
+			continue
 		}
+		firstIndex[kv] = i
+		jobs <- i
+	}
+	close(jobs)
+
+	// Probe the keys concurrently; each worker writes only to the result slots it owns.
+	var wg sync.WaitGroup
+	concurrency := min(group.EffectiveConfig.KeyValidationConcurrency, len(jobs))
+	for range concurrency {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				kv := keyValues[i]
+				apiKey := existingKeyMap[kv]
+
+				isValid, validationErr := s.ValidateSingleKey(&apiKey, group)
+
+				results[i] = KeyTestResult{
+					KeyValue: kv,
+					IsValid:  isValid,
+					Error:    "",
+				}
+				if validationErr != nil {
+					results[i].Error = validationErr.Error()
+				}
+			}
+		}()
+	}
+	wg.Wait()
+
+	for _, i := range repeats {
+		results[i] = results[firstIndex[keyValues[i]]]
 	}
 
 	return results, nil
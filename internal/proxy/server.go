@@ -226,7 +226,10 @@ func (ps *ProxyServer) executeRequestWithRetry(
 	}
 
 	// ps.keyProvider.UpdateStatus(apiKey, group, true) // 请求成功不再重置成功次数，减少IO消耗
-	logrus.Debugf("Request for group %s succeeded on attempt %d with key %s", group.Name, retryCount+1, utils.MaskAPIKey(apiKey.KeyValue))
+	// Only mask the key when the message will actually be logged; this runs on every successful request.
+	if logrus.IsLevelEnabled(logrus.DebugLevel) {
+		logrus.Debugf("Request for group %s succeeded on attempt %d with key %s", group.Name, retryCount+1, utils.MaskAPIKey(apiKey.KeyValue))
+	}
 	ps.logRequest(c, group, apiKey, startTime, resp.StatusCode, retryCount+1, nil, isStream, upstreamURL)
 
 	for key, values := range resp.Header {
@@ -42,35 +42,35 @@ func NewKeyManualValidationService(db *gorm.DB, validator *keypool.KeyValidator,
 
 // StartValidationTask starts a new manual validation task for a given group.
 func (s *KeyManualValidationService) StartValidationTask(group *models.Group) (*TaskStatus, error) {
-	var keys []models.APIKey
-	if err := s.DB.Where("group_id = ?", group.ID).Find(&keys).Error; err != nil {
-		return nil, fmt.Errorf("failed to get keys for group %s: %w", group.Name, err)
+	var totalKeys int64
+	if err := s.DB.Model(&models.APIKey{}).Where("group_id = ?", group.ID).Count(&totalKeys).Error; err != nil {
+		return nil, fmt.Errorf("failed to count keys for group %s: %w", group.Name, err)
 	}
 
-	if len(keys) == 0 {
+	if totalKeys == 0 {
 		return nil, fmt.Errorf("no keys to validate in group %s", group.Name)
 	}
 
 	timeout := 30 * time.Minute
 
-	taskStatus, err := s.TaskService.StartTask(TaskTypeKeyValidation, group.Name, len(keys), timeout)
+	taskStatus, err := s.TaskService.StartTask(TaskTypeKeyValidation, group.Name, int(totalKeys), timeout)
 	if err != nil {
 		return nil, err
 	}
 
 	// Run the validation in a separate goroutine
-	go s.runValidation(group, keys)
+	go s.runValidation(group, int(totalKeys))
 
 	return taskStatus, nil
 }
 
-func (s *KeyManualValidationService) runValidation(group *models.Group, keys []models.APIKey) {
+func (s *KeyManualValidationService) runValidation(group *models.Group, totalKeys int) {
 	logrus.Infof("Starting manual validation for group %s", group.Name)
 
-	jobs := make(chan models.APIKey, len(keys))
-	results := make(chan bool, len(keys))
+	concurrency := min(group.EffectiveConfig.KeyValidationConcurrency, totalKeys)
 
-	concurrency := group.EffectiveConfig.KeyValidationConcurrency
+	jobs := make(chan models.APIKey, concurrency)
+	results := make(chan bool, concurrency)
 
 	var wg sync.WaitGroup
 	for range concurrency {
@@ -78,10 +78,18 @@ func (s *KeyManualValidationService) runValidation(group *models.Group, keys []m
 		go s.validationWorker(&wg, group, jobs, results)
 	}
 
-	for _, key := range keys {
-		jobs <- key
-	}
-	close(jobs)
+	// Stream keys from the database in batches so memory does not grow with the group size.
+	var loadErr error
+	go func() {
+		defer close(jobs)
+		var batch []models.APIKey
+		loadErr = s.DB.Where("group_id = ?", group.ID).FindInBatches(&batch, chunkSize, func(tx *gorm.DB, batchNum int) error {
+			for _, key := range batch {
+				jobs <- key
+			}
+			return nil
+		}).Error
+	}()
 
 	go func() {
 		wg.Wait()
@@ -112,10 +120,19 @@ func (s *KeyManualValidationService) runValidation(group *models.Group, keys []m
 		logrus.Warnf("Failed to update final task progress: %v", err)
 	}
 
+	if loadErr != nil {
+		taskErr := fmt.Errorf("failed to load keys for group %s: %w", group.Name, loadErr)
+		if err := s.TaskService.EndTask(nil, taskErr); err != nil {
+			logrus.Errorf("Failed to end task with error for group %s: %v (original error: %v)", group.Name, err, taskErr)
+		}
+		logrus.Errorf("Manual validation aborted for group %s: %v", group.Name, taskErr)
+		return
+	}
+
 	result := ManualValidationResult{
-		TotalKeys:   len(keys),
+		TotalKeys:   processedCount,
 		ValidKeys:   validCount,
-		InvalidKeys: len(keys) - validCount,
+		InvalidKeys: processedCount - validCount,
 	}
 
 	// End the task and store the final result
@@ -1,10 +1,12 @@
 package services
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"gpt-load/internal/keypool"
 	"gpt-load/internal/models"
+	"hash/maphash"
 	"io"
 	"regexp"
 	"strings"
@@ -17,6 +19,13 @@ const (
 	chunkSize      = 1000
 )
 
+var (
+	// keyDelimiters splits raw key text on whitespace and common separators.
+	keyDelimiters = regexp.MustCompile(`[\s,;|\n\r\t]+`)
+	// validKeyChars matches the characters allowed in an API key.
+	validKeyChars = regexp.MustCompile(`^[a-zA-Z0-9_\-./+=:]+$`)
+)
+
 // AddKeysResult holds the result of adding multiple keys.
 type AddKeysResult struct {
 	AddedCount   int   `json:"added_count"`
@@ -88,30 +97,35 @@ func (s *KeyService) processAndCreateKeys(
 	keys []string,
 	progressCallback func(processed int),
 ) (addedCount int, ignoredCount int, err error) {
-	// 1. Get existing keys in the group for deduplication
+	// 1. Collect hashes of existing keys in the group for deduplication.
+	// 64-bit hashes keep the set small for large groups; collisions are negligible at this scale.
+	seed := maphash.MakeSeed()
+	knownKeyHashes := make(map[uint64]struct{})
 	var existingKeys []models.APIKey
-	if err := s.DB.Where("group_id = ?", groupID).Select("key_value").Find(&existingKeys).Error; err != nil {
+	err = s.DB.Model(&models.APIKey{}).Where("group_id = ?", groupID).Select("id, key_value").FindInBatches(&existingKeys, chunkSize, func(tx *gorm.DB, batch int) error {
+		for _, k := range existingKeys {
+			knownKeyHashes[maphash.String(seed, k.KeyValue)] = struct{}{}
+		}
+		return nil
+	}).Error
+	if err != nil {
 		return 0, 0, err
 	}
-	existingKeyMap := make(map[string]bool)
-	for _, k := range existingKeys {
-		existingKeyMap[k.KeyValue] = true
-	}
 
 	// 2. Prepare new keys for creation
 	var newKeysToCreate []models.APIKey
-	uniqueNewKeys := make(map[string]bool)
 
 	for _, keyVal := range keys {
 		trimmedKey := strings.TrimSpace(keyVal)
 		if trimmedKey == "" {
 			continue
 		}
-		if existingKeyMap[trimmedKey] || uniqueNewKeys[trimmedKey] {
+		keyHash := maphash.String(seed, trimmedKey)
+		if _, exists := knownKeyHashes[keyHash]; exists {
 			continue
 		}
 		if s.isValidKeyFormat(trimmedKey) {
-			uniqueNewKeys[trimmedKey] = true
+			knownKeyHashes[keyHash] = struct{}{}
 			newKeysToCreate = append(newKeysToCreate, models.APIKey{
 				GroupID:  groupID,
 				KeyValue: trimmedKey,
@@ -155,8 +169,7 @@ func (s *KeyService) ParseKeysFromText(text string) []string {
 	}
 
 	// 通用解析：通过分隔符分割文本，不使用复杂的正则表达式
-	delimiters := regexp.MustCompile(`[\s,;|\n\r\t]+`)
-	splitKeys := delimiters.Split(strings.TrimSpace(text), -1)
+	splitKeys := keyDelimiters.Split(strings.TrimSpace(text), -1)
 
 	for _, key := range splitKeys {
 		key = strings.TrimSpace(key)
@@ -191,8 +204,7 @@ func (s *KeyService) isValidKeyFormat(key string) bool {
 		return false
 	}
 
-	validChars := regexp.MustCompile(`^[a-zA-Z0-9_\-./+=:]+$`)
-	return validChars.MatchString(key)
+	return validKeyChars.MatchString(key)
 }
 
 // RestoreMultipleKeys handles the business logic of restoring keys from a text block.
@@ -337,14 +349,17 @@ func (s *KeyService) StreamKeysToWriter(groupID uint, statusFilter string, write
 		return fmt.Errorf("invalid status filter: %s", statusFilter)
 	}
 
+	// Write each batch with a single call instead of one write per key.
+	var buf bytes.Buffer
 	var keys []models.APIKey
 	err := query.FindInBatches(&keys, chunkSize, func(tx *gorm.DB, batch int) error {
+		buf.Reset()
 		for _, key := range keys {
-			if _, err := writer.Write([]byte(key.KeyValue + "\n")); err != nil {
-				return err
-			}
+			buf.WriteString(key.KeyValue)
+			buf.WriteByte('\n')
 		}
-		return nil
+		_, err := writer.Write(buf.Bytes())
+		return err
 	}).Error
 
 	return err
@@ -1,7 +1,6 @@
 package utils
 
 import (
-	"fmt"
 	"strings"
 )
 
@@ -11,7 +10,7 @@ func MaskAPIKey(key string) string {
 	if length <= 8 {
 		return key
 	}
-	return fmt.Sprintf("%s****%s", key[:4], key[length-4:])
+	return key[:4] + "****" + key[length-4:]
 }
 
 // TruncateString shortens a string to a maximum length.